@@ -440,6 +440,10 @@ class YouTube:
     def metadata(self) -> YouTubeMetadata:
         """Get the metadata for the video.
 
+        The raw innertube response is not kept. To inspect it, build the
+        metadata yourself with
+        ``YouTubeMetadata(InnerTube(client='WEB').updated_metadata(video_id), keep_raw=True)``.
+
         :rtype: YouTubeMetadata
         """
         if self._metadata:
@@ -448,9 +452,9 @@ class YouTube:
         innertube = InnerTube(client="WEB", use_oauth=self.use_oauth, allow_cache=self.allow_oauth_cache)
 
         innertube_response = innertube.updated_metadata(self.video_id)
-        self._metadata = innertube_response
+        self._metadata = YouTubeMetadata(innertube_response)
 
-        return YouTubeMetadata(self._metadata)
+        return self._metadata
 
     def register_on_progress_callback(self, func: Callable[[Any, bytes, int], None]):
         """Register a download progress callback function post initialization.
@@ -1,7 +1,15 @@
 """Module for interacting with YouTube search."""
 # Native python imports
+import json
 import logging
+from dataclasses import dataclass
 from enum import Enum
+from typing import Optional
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover
+    simdjson = None
 
 # Local imports
 from pytube import YouTube, Channel
@@ -10,6 +18,18 @@ from pytube.innertube import InnerTube
 
 logger = logging.getLogger(__name__)
 
+# Translation table that strips the thousands separators from view counts
+_NO_COMMA = str.maketrans('', '', ',')
+
+_WATCH_PREFIX = 'https://www.youtube.com/watch?v='
+_CHANNEL_PREFIX = 'https://www.youtube.com/channel/'
+
+
+def _raw_body(body):
+    """Return a response body as-is, so it can be decoded later."""
+    return body
+
+
 class Params(Enum):
     FILTER_CHANNEL = 'EgIQAg%3D%3D'
     FILTER_PLAYLIST = 'EgIQAw%3D%3D'
@@ -17,6 +37,121 @@ class Params(Enum):
     FILTER_MOVIE = 'EgIQBA%3D%3D'
 
 
+@dataclass(slots=True, repr=False, eq=False)
+class _LazyYouTube:
+    """Search result that defers constructing its :class:`YouTube <YouTube>`.
+
+    The fields parsed from the search results are available directly, any
+    other attribute is looked up on a YouTube object created on first use.
+    ``length_text`` is the duration as displayed on the search page (e.g.
+    ``'4:20'``); ``length`` is still the YouTube property, in seconds.
+    """
+    url: str
+    title: str
+    author: str
+    view_count: int
+    length_text: Optional[str]
+    _video: Optional[YouTube] = None
+
+    def __repr__(self):
+        video_id = self.url[len(_WATCH_PREFIX):]
+        return f'<pytube.contrib.search._LazyYouTube object: videoId={video_id}>'
+
+    @property
+    def video(self) -> YouTube:
+        """Return the underlying YouTube object, constructing it if necessary.
+
+        :rtype: YouTube
+        """
+        if self._video is None:
+            video = YouTube(self.url)
+            video.author = self.author
+            video.title = self.title
+            self._video = video
+        return self._video
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not fields. Private names are
+        #  never delegated, which also keeps copy and pickle from recursing.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.video, name)
+
+
+def _parse_video(video_details, _no_comma=_NO_COMMA):
+    # Extract relevant video information from the details.
+    # Some of this can be used to pre-populate attributes of the
+    #  YouTube object.
+    renderer = video_details['videoRenderer']
+    id = renderer['videoId']
+    url = _WATCH_PREFIX + id
+    title = renderer['title']['runs'][0]['text']
+    channel_name = renderer['ownerText']['runs'][0]['text']
+    view_count_renderer = renderer.get('viewCountText')
+    length_renderer = renderer.get('lengthText')
+
+    # Livestreams have "runs", non-livestreams have "simpleText",
+    #  and scheduled releases do not have 'viewCountText'
+    if view_count_renderer is not None:
+        if 'runs' in view_count_renderer:
+            view_count_text = view_count_renderer['runs'][0]['text']
+        else:
+            view_count_text = view_count_renderer['simpleText']
+        # Strip ' views' text, then remove commas
+        stripped_text = view_count_text.split(None, 1)[0].translate(_no_comma)
+        if stripped_text == 'No':
+            view_count = 0
+        else:
+            view_count = int(stripped_text)
+    else:
+        view_count = 0
+
+    if length_renderer is not None:
+        length_text = length_renderer['simpleText']
+    else:
+        length_text = None
+
+    # The YouTube object itself is only constructed once it is needed
+    return _LazyYouTube(
+        url=url,
+        title=title,
+        author=channel_name,
+        view_count=view_count,
+        length_text=length_text
+    )
+
+
+def _parse_channel(channel_details):
+    renderer = channel_details['channelRenderer']
+    channel_id = renderer['channelId']
+    channel_url = _CHANNEL_PREFIX + channel_id
+
+    return Channel(channel_url)
+
+
+# Maps each known renderer type to its parser, or None for renderers
+#  that are skipped
+_DISPATCH = {
+    'videoRenderer': _parse_video,
+    'channelRenderer': _parse_channel,
+    # Ads
+    'searchPyvRenderer': None,
+    # "recommended" type videos e.g. "people also watched" and "popular X"
+    #  that break up the search results
+    'shelfRenderer': None,
+    # Auto-generated "mix" playlist results
+    'radioRenderer': None,
+    # Playlist results
+    'playlistRenderer': None,
+    # 'people also searched for' results
+    'horizontalCardListRenderer': None,
+    # Can't seem to reproduce, probably related to typo fix suggestions
+    'didYouMeanRenderer': None,
+    # Seems to be the renderer used for the image shown on a no results page
+    'backgroundPromoRenderer': None,
+}
+
+
 class Search:
     def __init__(self, query: str, param: Params|None = None):
         """Initialize Search object.
@@ -28,11 +163,15 @@ class Search:
         self.param = param
         self._innertube_client = InnerTube(client='WEB')
 
-        # The first search, without a continuation, is structured differently
-        #  and contains completion suggestions, so we must store this separately
-        self._initial_results = None
+        # simdjson only materializes the keys we access, which avoids building
+        #  the large parts of each response that are never read (shelves,
+        #  playlists, etc.) A single parser is reused across continuations so
+        #  its internal buffers are only allocated once.
+        self._parser = simdjson.Parser() if simdjson else None
 
         self._results = None
+        # The first search, without a continuation, is structured differently
+        #  and contains completion suggestions, so we must store these separately
         self._completion_suggestions = None
 
         # Used for keeping track of query continuations so that new results
@@ -47,10 +186,9 @@ class Search:
         :returns:
             A list of autocomplete suggestions provided by YouTube for the query.
         """
-        if self._completion_suggestions:
-            return self._completion_suggestions
-        if self.results:
-            self._completion_suggestions = self._initial_results['refinements']
+        if self._completion_suggestions is None:
+            # The suggestions are stored when the first results are fetched
+            self.results
         return self._completion_suggestions
 
     @property
@@ -62,7 +200,11 @@ class Search:
 
         :rtype: list
         :returns:
-            A list of YouTube objects.
+            A list of results. Videos are ``_LazyYouTube`` wrappers: ``title``,
+            ``author``, ``url``, ``view_count`` and ``length_text`` come from
+            the search page, ``.video`` returns the :class:`YouTube <YouTube>`
+            object, and any other attribute is looked up on it. Channels are
+            :class:`Channel <Channel>` objects.
         """
         if self._results:
             return self._results
@@ -84,60 +226,53 @@ class Search:
         else:
             raise IndexError
 
-    def _parse_video(self, video_details):
-        # Extract relevant video information from the details.
-        # Some of this can be used to pre-populate attributes of the
-        #  YouTube object.
-        renderer = video_details['videoRenderer']
-        id = renderer['videoId']
-        url = f'https://www.youtube.com/watch?v={id}'
-        title = renderer['title']['runs'][0]['text']
-        channel_name = renderer['ownerText']['runs'][0]['text']
-        channel_uri = renderer['ownerText']['runs'][0]['navigationEndpoint']['commandMetadata']['webCommandMetadata']['url']
-        # Livestreams have "runs", non-livestreams have "simpleText",
-        #  and scheduled releases do not have 'viewCountText'
-        if 'viewCountText' in renderer:
-            if 'runs' in renderer['viewCountText']:
-                view_count_text = renderer['viewCountText']['runs'][0]['text']
-            else:
-                view_count_text = renderer['viewCountText']['simpleText']
-            # Strip ' views' text, then remove commas
-            stripped_text = view_count_text.split()[0].replace(',','')
-            if stripped_text == 'No':
-                view_count = 0
-            else:
-                view_count = int(stripped_text)
-        else:
-            view_count = 0
-
-        if 'lengthText' in renderer:
-            length = renderer['lengthText']['simpleText']
-        else:
-            length = None
+    def iter_results(self):
+        """Iterate over all results for the query, fetching more as needed.
 
-        metadata = {
-            'id': id,
-            'url': url,
-            'title': title,
-            'channel_name': channel_name,
-            'channel_url': channel_uri,
-            'view_count': view_count,
-            'length': length
-        }
+        Each result is yielded as soon as it is parsed, and the next set of
+        results is only requested once the previous set has been consumed.
+        Unlike ``.results``, nothing is stored on the Search object, so
+        results can be released by the caller once they are no longer needed.
 
-        # Construct YouTube object from metadata and append to results
-        video = YouTube(metadata['url'])
-        video.author = metadata['channel_name']
-        video.title = metadata['title']
-
-        return video
-
-    def _parse_channel(self, channel_details):
-        renderer = channel_details['channelRenderer']
-        channel_id = renderer['channelId']
-        channel_url = f"https://www.youtube.com/channel/{channel_id}"
-
-        return Channel(channel_url)
+        :rtype: Iterator
+        :returns:
+            A generator of results, in the same form as ``.results``.
+        """
+        # A separate parser keeps this generator's documents independent of
+        #  .results and .get_next_results() while it is suspended.
+        parser = simdjson.Parser() if simdjson else None
+        continuation = None
+        while True:
+            items, continuation = self._parse_response(
+                self._fetch_buffer(continuation),
+                parser
+            )
+            if items is not None:
+                yield from items
+
+            # Release the response before the parser is reused
+            del items
+            if not continuation:
+                break
+
+    def filter_by_view_count_ge(self, view_count):
+        """Return the video results with at least the given number of views.
+
+        Only results that have already been fetched are considered.
+
+        :param int view_count:
+            The minimum number of views.
+        :rtype: list
+        :returns:
+            A list of ``_LazyYouTube`` video results, see ``.results``.
+        """
+        if not self.results:
+            return []
+        return [
+            result
+            for result in self.results
+            if isinstance(result, _LazyYouTube) and result.view_count >= view_count
+        ]
 
     def fetch_and_parse(self, continuation=None):
         """Fetch from the innertube API and parse the results.
@@ -146,12 +281,82 @@ class Search:
             Continuation string for fetching results.
         :rtype: tuple
         :returns:
-            A tuple of a list of YouTube objects and a continuation string.
+            A tuple of a list of results, in the same form as ``.results``,
+            and a continuation string.
+        """
+        items, next_continuation = self._parse_response(
+            self._fetch_buffer(continuation),
+            self._parser
+        )
+        if items is None:
+            return None, next_continuation
+        return list(items), next_continuation
+
+    def fetch_many(self, n):
+        """Fetch up to ``n`` further sets of results.
+
+        Like ``.get_next_results()``, this updates the results property instead
+        of returning the results, and stops early once there are no more results.
+
+        :param int n:
+            The maximum number of sets of results to fetch.
         """
-        # Begin by executing the query and identifying the relevant sections
-        #  of the results
-        raw_results = self.fetch_query(continuation)
+        if n < 1:
+            return
 
+        self.results
+        for _ in range(n):
+            if not self._current_continuation:
+                break
+            self.get_next_results()
+
+    def _parse_response(self, buf, parser):
+        """Decode a raw response and find its results and next continuation.
+
+        The completion suggestions are stored from the first response that
+        contains them.
+
+        :param bytes buf:
+            The raw response body.
+        :param parser:
+            The simdjson.Parser to decode with, or None to use ``json.loads``.
+        :rtype: tuple
+        :returns:
+            A tuple of a generator of results (or None if the response
+            has no results) and the next continuation string (or None). The
+            generator holds on to the decoded response, so it must be
+            exhausted or released before ``parser`` is used again.
+        """
+        if parser is None:
+            raw_results = json.loads(buf)
+        else:
+            raw_results = parser.parse(buf, recursive=False)
+
+        if self._completion_suggestions is None and 'refinements' in raw_results:
+            # Copy the suggestions out, as simdjson documents are invalidated
+            #  once the parser is reused for the next request
+            refinements = raw_results['refinements']
+            if not isinstance(refinements, list):
+                refinements = refinements.as_list()
+            self._completion_suggestions = refinements
+
+        item_renderer, next_continuation = self._parse_sections(raw_results)
+
+        # If the itemSectionRenderer doesn't exist, assume no results.
+        if not item_renderer:
+            return None, next_continuation
+        return self._parse_section(item_renderer), next_continuation
+
+    def _parse_sections(self, raw_results):
+        """Find the item section and the next continuation string of a response.
+
+        :param dict raw_results:
+            The raw json object returned by the innertube API.
+        :rtype: tuple
+        :returns:
+            A tuple of the itemSectionRenderer (or None) and the next
+            continuation string (or None).
+        """
         # Initial result is handled by try block, continuations by except block
         try:
             sections = raw_results['contents']['twoColumnSearchResultsRenderer']['primaryContents']['sectionListRenderer']['contents']
@@ -171,68 +376,50 @@ class Search:
         else:
             next_continuation = None
 
-        results = None
-
-        # If the itemSectionRenderer doesn't exist, assume no results.
-        if item_renderer:
-
-            results = []
-            contents = item_renderer['contents']
-
-            for details in contents:
-
-                # Skip over ads
-                if details.get('searchPyvRenderer', {}).get('ads', None):
-                    continue
+        return item_renderer, next_continuation
 
-                # Skip "recommended" type videos e.g. "people also watched" and "popular X"
-                #  that break up the search results
-                elif 'shelfRenderer' in details:
-                    continue
+    def _parse_section(self, item_renderer):
+        """Parse the results contained in an itemSectionRenderer.
 
-                # Skip auto-generated "mix" playlist results
-                elif 'radioRenderer' in details:
-                    continue
-
-                # Skip playlist results
-                elif 'playlistRenderer' in details:
-                    continue
-
-                # Skip 'people also searched for' results
-                elif 'horizontalCardListRenderer' in details:
-                    continue
-
-                # Can't seem to reproduce, probably related to typo fix suggestions
-                elif 'didYouMeanRenderer' in details:
-                    continue
-
-                # Seems to be the renderer used for the image shown on a no results page
-                elif 'backgroundPromoRenderer' in details:
-                    continue
-
-                # Parse video results
-                elif 'videoRenderer' in details:
-                    result = self._parse_video(details)
-
-                # Parse channel results
-                elif 'channelRenderer' in details:
-                    result = self._parse_channel(details)
-                
-                else:
-
-                    logger.warning('Unexpected renderer encountered.')
-                    logger.warning(f'Renderer name: {details.keys()}')
-                    logger.warning(f'Search term: {self.query}')
-                    logger.warning(
-                        'Please open an issue at '
-                        'https://github.com/pytube/pytube/issues '
-                        'and provide this log output.'
-                    )
-                    continue
+        :param dict item_renderer:
+            The itemSectionRenderer of a response.
+        :rtype: Iterator
+        :returns:
+            A generator of ``_LazyYouTube`` and :class:`Channel <Channel>`
+            results, yielded as they are parsed.
+        """
+        for details in item_renderer['contents']:
+            result = self._dispatch(details)
+            if result is not None:
+                yield result
 
-                results.append(result)
+    def _dispatch(self, details, _dispatch_table=_DISPATCH):
+        """Parse a single result item with the parser for its renderer type.
 
-        return results, next_continuation
+        :param dict details:
+            A single item of an itemSectionRenderer.
+        :returns:
+            The parsed result, or None if the item is skipped.
+        """
+        # Find the renderer type of this item
+        for renderer_name in details:
+            if renderer_name in _dispatch_table:
+                break
+        else:
+            logger.warning('Unexpected renderer encountered.')
+            logger.warning(f'Renderer name: {details.keys()}')
+            logger.warning(f'Search term: {self.query}')
+            logger.warning(
+                'Please open an issue at '
+                'https://github.com/pytube/pytube/issues '
+                'and provide this log output.'
+            )
+            return None
+
+        handler = _dispatch_table[renderer_name]
+        if handler is None:
+            return None
+        return handler(details)
 
     def fetch_query(self, continuation=None):
         """Fetch raw results from the innertube API.
@@ -243,7 +430,18 @@ class Search:
         :returns:
             The raw json object returned by the innertube API.
         """
-        query_results = self._innertube_client.search(self.query, self.param, continuation)
-        if not self._initial_results:
-            self._initial_results = query_results
-        return query_results  # noqa:R504
+        return self._innertube_client.search(self.query, self.param, continuation)
+
+    def _fetch_buffer(self, continuation=None):
+        """Fetch the raw, undecoded bytes of a response.
+
+        :param str continuation:
+            Continuation string for fetching results.
+        :rtype: bytes
+        """
+        return self._innertube_client.search(
+            self.query,
+            self.param,
+            continuation,
+            parse_bytes=_raw_body
+        )
@@ -569,7 +569,7 @@ def metadata(initial_data) -> Optional[YouTubeMetadata]:
         metadata_rows: List = initial_data["contents"]["twoColumnWatchNextResults"]["results"]["results"]["contents"][1]["videoSecondaryInfoRenderer"]["metadataRowContainer"]["metadataRowContainerRenderer"]["rows"]
     except (KeyError, IndexError):
         # If there's an exception accessing this data, it probably doesn't exist.
-        return YouTubeMetadata([])
+        return YouTubeMetadata([], keep_raw=True)
 
     # Rows appear to only have "metadataRowRenderer" or "metadataRowHeaderRenderer"
     #  and we only care about the former, so we filter the others
@@ -582,4 +582,4 @@ def metadata(initial_data) -> Optional[YouTubeMetadata]:
     #  and build a metadata object from this new list
     metadata_rows = [x["metadataRowRenderer"] for x in metadata_rows]
 
-    return YouTubeMetadata(metadata_rows)
+    return YouTubeMetadata(metadata_rows, keep_raw=True)
@@ -367,8 +367,12 @@ class InnerTube:
             'racyCheckOk': True
         }
 
-    def _call_api(self, endpoint, query, data):
-        """Make a request to a given endpoint with the provided query parameters and data."""
+    def _call_api(self, endpoint, query, data, parse_bytes=json.loads):
+        """Make a request to a given endpoint with the provided query parameters and data.
+
+        :param callable parse_bytes:
+            Callable used to decode the raw response body. Defaults to ``json.loads``.
+        """
         # Remove the API key if oauth is being used.
         if self.use_oauth:
             del query['key']
@@ -394,7 +398,7 @@ class InnerTube:
             headers=headers,
             data=data
         )
-        return json.loads(response.read())
+        return parse_bytes(response.read())
 
     def browse(self):
         """Make a request to the browse endpoint.
@@ -448,11 +452,19 @@ class InnerTube:
         query.update(self.base_params)
         return self._call_api(endpoint, query, self.base_data)
 
-    def search(self, search_query: str, filter: Enum, continuation=None):
+    def search(
+        self,
+        search_query: str,
+        filter: Enum,
+        continuation=None,
+        parse_bytes=json.loads
+    ):
         """Make a request to the search endpoint.
 
         :param str search_query:
             The query to search.
+        :param callable parse_bytes:
+            Callable used to decode the raw response body. Defaults to ``json.loads``.
         :rtype: dict
         :returns:
             Raw search query results.
@@ -467,7 +479,7 @@ class InnerTube:
         if continuation:
             data['continuation'] = continuation
         data.update(self.base_data)
-        return self._call_api(endpoint, query, data)
+        return self._call_api(endpoint, query, data, parse_bytes=parse_bytes)
 
     def verify_age(self, video_id):
         """Make a request to the age_verify endpoint.
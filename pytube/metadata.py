@@ -1,10 +1,64 @@
 """This module contains the YouTubeMetadata class."""
 import json
-from typing import Dict, Optional
+from typing import Dict
+
+from pytube.exceptions import PytubeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize ``obj`` to a JSON string, using orjson when it is installed.
+
+    The fallback matches orjson's output: compact separators and unescaped UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+
+def _extract_view_count(metadata: dict, action: dict):
+    metadata['viewCount'] = action['viewCount']['videoViewCountRenderer']['originalViewCount']
+
+
+def _extract_title(metadata: dict, action: dict):
+    metadata['title'] = action['title']['runs'][0]['text']
+
+
+def _extract_relative_date(metadata: dict, action: dict):
+    metadata['relativeDate'] = action['dateText']['simpleText']
+
+
+def _extract_description(metadata: dict, action: dict):
+    runs = action['description']['runs']
+    metadata['description'] = "".join(run["text"] for run in runs)
+
+
+# Maps the name of each update action to the function that extracts its metadata
+_ACTION_HANDLERS = {
+    'updateViewershipAction': _extract_view_count,
+    'updateTitleAction': _extract_title,
+    'updateDateAction': _extract_relative_date,
+    'updateDescriptionAction': _extract_description,
+}
+
 
 class YouTubeMetadata:
-    def __init__(self, metadata: dict):
-        self._raw_metadata = metadata
+    __slots__ = ('_raw_metadata', '_metadata')
+
+    def __init__(self, metadata: dict, keep_raw: bool = False):
+        """Construct a :class:`YouTubeMetadata <YouTubeMetadata>`.
+
+        :param dict metadata:
+            The raw response of the updated_metadata innertube endpoint.
+        :param bool keep_raw:
+            (Optional) Keep a reference to the raw response, which is otherwise
+            dropped once parsed. Defaults to False.
+        """
+        self._raw_metadata = metadata if keep_raw else None
         self._metadata = {}
 
         self.__parse_metadata(metadata)
@@ -14,28 +68,31 @@ class YouTubeMetadata:
 
         actions = metadata.get('actions', [])
 
-        for action in actions:
-            
-            if "updateViewershipAction" in action:
-                self._metadata['viewCount'] = action['updateViewershipAction']['viewCount']['videoViewCountRenderer']['originalViewCount']
-
-            if "updateTitleAction" in action:
-                self._metadata['title'] = action['updateTitleAction']['title']['runs'][0]['text']
-
-            if "updateDateAction" in action:
-                self._metadata['relativeDate'] = action['updateDateAction']['dateText']['simpleText']
+        # Bound to locals since this loop runs for every action of every video
+        get_handler = _ACTION_HANDLERS.get
+        parsed = self._metadata
 
-            if "updateDescriptionAction" in action:
-                self._metadata['description'] = "".join(list(map(lambda run: run["text"], action['updateDescriptionAction']['description']['runs'])))
+        for action in actions:
+            for action_name, payload in action.items():
+                handler = get_handler(action_name)
+                if handler is not None:
+                    handler(parsed, payload)
 
     def __getitem__(self, key):
         return self._metadata[key]
 
     def __str__(self):
-        return json.dumps(self._metadata)
+        return _dumps(self._metadata)
 
     @property
-    def raw_metadata(self) -> Optional[Dict]:
+    def raw_metadata(self) -> Dict:
+        """Return the raw response the metadata was parsed from.
+
+        :raises PytubeError:
+            If the object was constructed without ``keep_raw=True``.
+        """
+        if self._raw_metadata is None:
+            raise PytubeError('Raw metadata is only kept when keep_raw=True')
         return self._raw_metadata
 
     @property
@@ -20,6 +20,9 @@ setup(
     author_email="hey@pytube.io",
     packages=["pytube", "pytube.contrib"],
     package_data={"": ["LICENSE"],},
+    extras_require={
+        "speedups": ["orjson", "pysimdjson"],
+    },
     url="https://github.com/pytube/pytube",
     license="The Unlicense (Unlicense)",
     entry_points={
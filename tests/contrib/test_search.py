@@ -0,0 +1,262 @@
+import json
+from unittest import mock
+
+from pytube import Search, Params, YouTube
+
+
+def _video(video_id, title, views='1,234 views', length='4:20'):
+    renderer = {
+        'videoId': video_id,
+        'title': {'runs': [{'text': title}]},
+        'ownerText': {'runs': [{
+            'text': 'Channel Name',
+            'navigationEndpoint': {'commandMetadata': {'webCommandMetadata': {
+                'url': '/c/ChannelName'
+            }}}
+        }]},
+    }
+    if views is not None:
+        renderer['viewCountText'] = {'simpleText': views}
+    if length is not None:
+        renderer['lengthText'] = {'simpleText': length}
+    return {'videoRenderer': renderer}
+
+
+def _continuation(token):
+    return {'continuationItemRenderer': {'continuationEndpoint': {
+        'continuationCommand': {'token': token}
+    }}}
+
+
+initial_response = {
+    'refinements': ['query one', 'query two'],
+    'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {
+        'sectionListRenderer': {'contents': [
+            {'itemSectionRenderer': {'contents': [
+                {'searchPyvRenderer': {'ads': [{}]}},
+                _video('aaaaaaaaaaa', 'First'),
+                {'shelfRenderer': {}},
+                {'channelRenderer': {'channelId': 'UCs6nmQViDpUw0nuIx9c_WvA'}},
+                {'radioRenderer': {}},
+                _video('bbbbbbbbbbb', 'Second', views='No views', length=None),
+            ]}},
+            _continuation('next-page'),
+        ]}
+    }}}
+}
+
+continuation_response = {
+    'onResponseReceivedCommands': [{'appendContinuationItemsAction': {
+        'continuationItems': [
+            {'itemSectionRenderer': {'contents': [
+                _video('ccccccccccc', 'Third', views=None),
+            ]}},
+        ]
+    }}]
+}
+
+second_continuation_response = {
+    'onResponseReceivedCommands': [{'appendContinuationItemsAction': {
+        'continuationItems': [
+            {'itemSectionRenderer': {'contents': [
+                _video('ddddddddddd', 'Fourth'),
+            ]}},
+            _continuation('page-3'),
+        ]
+    }}]
+}
+
+
+def _mock_responses(execute_request, *responses):
+    execute_request.return_value.read.side_effect = [
+        json.dumps(r).encode('utf-8') for r in responses
+    ]
+
+
+@mock.patch('pytube.request._execute_request')
+def test_results(execute_request):
+    _mock_responses(execute_request, initial_response)
+    s = Search('query', Params.FILTER_VIDEO)
+    results = s.results
+    assert len(results) == 3
+    assert results[0].watch_url == 'https://youtube.com/watch?v=aaaaaaaaaaa'
+    assert results[0].title == 'First'
+    assert results[0].author == 'Channel Name'
+    assert results[1].channel_url == (
+        'https://www.youtube.com/channel/UCs6nmQViDpUw0nuIx9c_WvA'
+    )
+    assert results[2].title == 'Second'
+    assert s.completion_suggestions == ['query one', 'query two']
+
+
+@mock.patch('pytube.request._execute_request')
+def test_get_next_results(execute_request):
+    _mock_responses(execute_request, initial_response, continuation_response)
+    s = Search('query', Params.FILTER_VIDEO)
+    assert len(s.results) == 3
+    s.get_next_results()
+    assert len(s.results) == 4
+    assert s.results[3].title == 'Third'
+    assert s.completion_suggestions == ['query one', 'query two']
+
+
+@mock.patch('pytube.request._execute_request')
+def test_unexpected_renderer_is_skipped(execute_request, caplog):
+    response = {
+        'onResponseReceivedCommands': [{'appendContinuationItemsAction': {
+            'continuationItems': [
+                {'itemSectionRenderer': {'contents': [
+                    {'unknownRenderer': {}},
+                    _video('aaaaaaaaaaa', 'First'),
+                ]}},
+            ]
+        }}]
+    }
+    _mock_responses(execute_request, response)
+    s = Search('query', Params.FILTER_VIDEO)
+    results, continuation = s.fetch_and_parse()
+    assert [r.title for r in results] == ['First']
+    assert continuation is None
+    assert 'Unexpected renderer encountered.' in caplog.text
+
+
+@mock.patch('pytube.contrib.search.simdjson', None)
+@mock.patch('pytube.request._execute_request')
+def test_results_without_simdjson(execute_request):
+    _mock_responses(execute_request, initial_response, continuation_response)
+    s = Search('query', Params.FILTER_VIDEO)
+    assert len(s.results) == 3
+    s.get_next_results()
+    assert s.results[3].title == 'Third'
+    assert s.completion_suggestions == ['query one', 'query two']
+
+
+@mock.patch('pytube.request._execute_request')
+def test_video_results_are_lazy(execute_request):
+    _mock_responses(execute_request, initial_response)
+    s = Search('query', Params.FILTER_VIDEO)
+    result = s.results[0]
+    assert result._video is None
+    assert result.view_count == 1234
+    assert result.length_text == '4:20'
+    assert s.results[2].view_count == 0
+    assert s.results[2].length_text is None
+    assert repr(result) == '<pytube.contrib.search._LazyYouTube object: videoId=aaaaaaaaaaa>'
+
+    assert result.video_id == 'aaaaaaaaaaa'
+    assert isinstance(result.video, YouTube)
+    assert result.video is result._video
+    assert result.video.title == 'First'
+    assert result.video.author == 'Channel Name'
+
+    # Anything that isn't parsed from the search page comes from YouTube
+    with mock.patch.object(YouTube, 'length', new_callable=mock.PropertyMock) as length:
+        length.return_value = 260
+        assert result.length == 260
+
+
+@mock.patch('pytube.request._execute_request')
+def test_fetch_many(execute_request):
+    _mock_responses(
+        execute_request,
+        initial_response,
+        second_continuation_response,
+        continuation_response
+    )
+    s = Search('query', Params.FILTER_VIDEO)
+    s.fetch_many(5)
+    assert [r.title for r in s.results[3:]] == ['Fourth', 'Third']
+    assert s._current_continuation is None
+    assert execute_request.call_count == 3
+    assert s.completion_suggestions == ['query one', 'query two']
+
+
+@mock.patch('pytube.request._execute_request')
+def test_fetch_many_stops_after_n(execute_request):
+    _mock_responses(
+        execute_request,
+        initial_response,
+        second_continuation_response,
+        continuation_response
+    )
+    s = Search('query', Params.FILTER_VIDEO)
+    s.fetch_many(1)
+    assert [r.title for r in s.results[3:]] == ['Fourth']
+    assert s._current_continuation == 'page-3'
+    assert execute_request.call_count == 2
+
+
+@mock.patch('pytube.request._execute_request')
+def test_fetch_many_zero_sends_no_request(execute_request):
+    s = Search('query', Params.FILTER_VIDEO)
+    s.fetch_many(0)
+    assert execute_request.call_count == 0
+
+
+@mock.patch('pytube.request._execute_request')
+def test_filter_by_view_count_ge(execute_request):
+    _mock_responses(execute_request, initial_response, continuation_response)
+    s = Search('query', Params.FILTER_VIDEO)
+    assert [r.title for r in s.filter_by_view_count_ge(1)] == ['First']
+    assert [r.title for r in s.filter_by_view_count_ge(0)] == ['First', 'Second']
+    s.get_next_results()
+    assert [r.title for r in s.filter_by_view_count_ge(0)] == ['First', 'Second', 'Third']
+    assert s.filter_by_view_count_ge(10000) == []
+
+
+@mock.patch('pytube.request._execute_request')
+def test_iter_results(execute_request):
+    _mock_responses(execute_request, initial_response, continuation_response)
+    s = Search('query', Params.FILTER_VIDEO)
+    results = list(s.iter_results())
+    assert len(results) == 4
+    assert [r.title for r in results if hasattr(r, 'view_count')] == [
+        'First', 'Second', 'Third'
+    ]
+    assert execute_request.call_count == 2
+    assert s._results is None
+
+
+@mock.patch('pytube.request._execute_request')
+def test_iter_results_fetches_lazily(execute_request):
+    _mock_responses(
+        execute_request,
+        initial_response,
+        initial_response,
+        continuation_response
+    )
+    s = Search('query', Params.FILTER_VIDEO)
+    results = s.iter_results()
+    assert next(results).title == 'First'
+    assert execute_request.call_count == 1
+    # Other requests can be made while the generator is suspended
+    assert len(s.results) == 3
+    assert len(list(results)) == 3
+
+
+@mock.patch('pytube.request._execute_request')
+def test_completion_suggestions_fetch_results(execute_request):
+    _mock_responses(execute_request, initial_response)
+    s = Search('query', Params.FILTER_VIDEO)
+    assert s.completion_suggestions == ['query one', 'query two']
+    assert type(s.completion_suggestions) is list
+    assert len(s.results) == 3
+    assert execute_request.call_count == 1
+
+
+@mock.patch('pytube.request._execute_request')
+def test_view_count_with_unusual_whitespace(execute_request):
+    response = {
+        'onResponseReceivedCommands': [{'appendContinuationItemsAction': {
+            'continuationItems': [
+                {'itemSectionRenderer': {'contents': [
+                    _video('aaaaaaaaaaa', 'First', views='1,234\xa0views'),
+                    _video('bbbbbbbbbbb', 'Second', views=' 56 views'),
+                ]}},
+            ]
+        }}]
+    }
+    _mock_responses(execute_request, response)
+    s = Search('query', Params.FILTER_VIDEO)
+    results, _ = s.fetch_and_parse()
+    assert [r.view_count for r in results] == [1234, 56]
@@ -1,5 +1,11 @@
 """Unit tests for the :module:`metadata <metadata>` module."""
+from unittest import mock
+
+import pytest
+
 from pytube import extract
+from pytube.exceptions import PytubeError
+from pytube.metadata import YouTubeMetadata
 
 
 def test_extract_metadata_empty():
@@ -14,3 +20,63 @@ def test_metadata_from_initial_data(stream_dict):
     assert 'contents' in ytmd.raw_metadata[0]
     assert len(ytmd.metadata) > 0
     assert 'Song' in ytmd.metadata[0]
+
+
+def _str_metadata():
+    return YouTubeMetadata({
+        'actions': [
+            {'updateTitleAction': {'title': {'runs': [{'text': 'Tîtle'}]}}},
+            {'updateDateAction': {'dateText': {'simpleText': '2 days ago'}}},
+            {'updateDescriptionAction': {'description': {'runs': [
+                {'text': 'Line one\n'},
+                {'text': 'Line two'},
+            ]}}},
+        ]
+    })
+
+
+_EXPECTED_STR = (
+    '{"title":"Tîtle","relativeDate":"2 days ago",'
+    '"description":"Line one\\nLine two"}'
+)
+
+
+def test_metadata_str():
+    assert str(_str_metadata()) == _EXPECTED_STR
+
+
+@mock.patch('pytube.metadata.orjson', None)
+def test_metadata_str_without_orjson():
+    assert str(_str_metadata()) == _EXPECTED_STR
+
+
+def test_metadata_has_no_instance_dict():
+    ytmd = YouTubeMetadata({})
+    assert not hasattr(ytmd, '__dict__')
+
+
+def test_metadata_ignores_unknown_action_keys():
+    ytmd = YouTubeMetadata({
+        'actions': [
+            {
+                'clickTrackingParams': 'abc',
+                'updateViewershipAction': {'viewCount': {'videoViewCountRenderer': {
+                    'originalViewCount': '1234'
+                }}},
+            },
+            {'updateToggleButtonTextAction': {}},
+        ]
+    })
+    assert ytmd.metadata == {'viewCount': '1234'}
+
+
+def test_raw_metadata_is_dropped_by_default():
+    ytmd = YouTubeMetadata({'actions': []})
+    with pytest.raises(PytubeError):
+        ytmd.raw_metadata
+
+
+def test_raw_metadata_kept():
+    raw = {'actions': []}
+    ytmd = YouTubeMetadata(raw, keep_raw=True)
+    assert ytmd.raw_metadata is raw